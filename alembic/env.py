@@ -15,7 +15,7 @@ from app.database.models import Review  # noqa
 config = context.config
 
 # Override sqlalchemy.url with settings
-# Keep psycopg prefix for async operations - Alembic will use async_engine_from_config
+# Keep asyncpg prefix for async operations - Alembic will use async_engine_from_config
 config.set_main_option("sqlalchemy.url", settings.database_url)
 
 # Interpret the config file for Python logging.
@@ -29,9 +29,9 @@ target_metadata = Base.metadata
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
-    # For offline mode, remove async driver prefix (psycopg3 supports sync operations)
-    if "+psycopg" in url:
-        url = url.replace("+psycopg", "")
+    # For offline mode, remove async driver prefix (only the dialect is needed to render SQL)
+    if "+asyncpg" in url:
+        url = url.replace("+asyncpg", "")
     context.configure(
         url=url,
         target_metadata=target_metadata,
@@ -53,7 +53,7 @@ def do_run_migrations(connection: Connection) -> None:
 async def run_async_migrations() -> None:
     """Run migrations in 'online' mode."""
     configuration = config.get_section(config.config_ini_section)
-    # Keep psycopg async driver prefix for async operations
+    # Keep asyncpg async driver prefix for async operations
     configuration["sqlalchemy.url"] = settings.database_url
     connectable = async_engine_from_config(
         configuration,
@@ -0,0 +1,64 @@
+"""add reviews_version change counter
+
+Revision ID: 79ddb7672e87
+Revises:
+Create Date: 2026-10-14 06:25:32.649664
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '79ddb7672e87'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Fresh databases get the table, counter row and trigger from init_db's create_all
+    if not sa.inspect(bind).has_table("reviews"):
+        return
+
+    # pg_current_xact_id() in the trigger function is new in PostgreSQL 13
+    if bind.dialect.server_version_info < (13,):
+        raise RuntimeError("The reviews_version trigger requires PostgreSQL 13 or newer")
+
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS reviews_version ("
+        "id INTEGER NOT NULL PRIMARY KEY, version BIGINT NOT NULL)"
+    )
+    op.execute(
+        "INSERT INTO reviews_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING"
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_reviews_version() RETURNS trigger AS $$
+        BEGIN
+            -- Once per transaction: skip if this transaction already bumped the row
+            UPDATE reviews_version SET version = version + 1
+            WHERE id = 1 AND xmin <> pg_current_xact_id()::xid;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS reviews_bump_version ON reviews")
+    op.execute(
+        """
+        CREATE TRIGGER reviews_bump_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON reviews
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_reviews_version()
+        """
+    )
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("reviews"):
+        op.execute("DROP TRIGGER IF EXISTS reviews_bump_version ON reviews")
+    op.execute("DROP FUNCTION IF EXISTS bump_reviews_version()")
+    op.execute("DROP TABLE IF EXISTS reviews_version")
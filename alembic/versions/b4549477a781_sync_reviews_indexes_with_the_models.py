@@ -0,0 +1,63 @@
+"""sync reviews indexes with the models
+
+Revision ID: b4549477a781
+Revises: 79ddb7672e87
+Create Date: 2026-10-14 06:29:19.958989
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4549477a781'
+down_revision: Union[str, None] = '79ddb7672e87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fresh databases get the current index set from init_db's create_all
+    if not sa.inspect(op.get_bind()).has_table("reviews"):
+        return
+
+    # CONCURRENTLY keeps reviews writable while the indexes build; it cannot run
+    # inside a transaction
+    with op.get_context().autocommit_block():
+        # Keyset pages of one listing (GET /reviews/hostaway?listing_id=...)
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reviews_listing_recent "
+            "ON reviews (listing_id, submitted_at DESC, id DESC)"
+        )
+        # Approved reviews and approved IDs of one listing
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reviews_approved_recent "
+            "ON reviews (listing_id, submitted_at DESC) INCLUDE (id) WHERE is_approved = true"
+        )
+        # Superseded by ix_reviews_approved_recent
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_reviews_approved_listing_date")
+        # Prefixes of ix_reviews_listing_recent; approved lookups use ix_reviews_approved_recent
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_reviews_listing_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_review_listing_approved")
+        # Duplicate of the primary key index
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_reviews_id")
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("reviews"):
+        return
+
+    # Restores the listing indexes this revision replaced; the superseded approved
+    # and primary key duplicates are not rebuilt
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reviews_listing_id "
+            "ON reviews (listing_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_review_listing_approved "
+            "ON reviews (listing_id, is_approved, submitted_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_reviews_listing_recent")
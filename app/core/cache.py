@@ -0,0 +1,84 @@
+"""In-process caching helpers"""
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after a fixed TTL.
+    
+    Operations never await, so the cache is safe to share between coroutines
+    on one event loop. It is per process and not shared between workers.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize cache.
+        
+        Args:
+            maxsize: Maximum number of entries; least recently used are evicted first
+            ttl: Seconds an entry stays valid after it is set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        
+        # Format: {key: (expires_at, value)}, ordered from least to most recently used
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+            
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._data[key] = (monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove an entry.
+        
+        Args:
+            key: Cache key
+            default: Value returned if the key is not cached
+            
+        Returns:
+            Removed value or default
+        """
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
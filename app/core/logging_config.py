@@ -1,28 +1,60 @@
+import atexit
 import logging
+import queue
 import sys
+from contextvars import ContextVar
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Request ID of the request being handled in the current context ("-" outside requests)
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Background listener that performs the actual handler I/O
+_queue_listener: QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background logging listener, if running"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request ID to log records as ``%(request_id)s``"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
 
 
 def setup_logging(log_level: str = "INFO", log_file: str | None = None) -> None:
     """
     Configure application-wide logging.
     
+    Records are queued by a QueueHandler on the root logger and written to the
+    console/file handlers by a background QueueListener thread, so slow writes
+    and log rotation never block request handling.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file. If None, logs only to console.
     """
+    global _queue_listener
+    
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
     # Create formatters
     detailed_formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        fmt="%(asctime)s | %(levelname)-8s | %(request_id)s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     
     console_formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(message)s",
+        fmt="%(asctime)s | %(levelname)-8s | %(request_id)s | %(message)s",
         datefmt="%H:%M:%S"
     )
     
@@ -30,14 +62,15 @@ def setup_logging(log_level: str = "INFO", log_file: str | None = None) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers (and any previous listener) to avoid duplicates
+    _stop_queue_listener()
     root_logger.handlers.clear()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
     
     # File handler (if specified)
     if log_file:
@@ -52,13 +85,26 @@ def setup_logging(log_level: str = "INFO", log_file: str | None = None) -> None:
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(detailed_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Route root logger records through a queue to the background listener.
+    # The request ID filter runs on the queue handler, i.e. in the caller's
+    # context, before the record is handed to the listener thread.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    root_logger.addHandler(queue_handler)
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # Set levels for third-party loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.error").setLevel(logging.INFO)
 
 
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
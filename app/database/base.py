@@ -1,18 +1,62 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
 
 
-# Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    future=True
+def _create_engine(url: str, pool_size: int) -> AsyncEngine:
+    """
+    Create an async engine with the shared pool and driver settings.
+    
+    Args:
+        url: Database connection URL
+        pool_size: Number of persistent connections kept in the pool
+        
+    Returns:
+        AsyncEngine instance
+    """
+    return create_async_engine(
+        url,
+        echo=settings.database_echo,
+        pool_size=pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        query_cache_size=settings.db_query_cache_size,
+        connect_args={
+            # SQLAlchemy's asyncpg adapter cache and asyncpg's own statement cache
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "statement_cache_size": settings.db_statement_cache_size,
+            # JIT planning only slows down the short queries this API runs
+            "server_settings": {"jit": "off"},
+        },
+        future=True
+    )
+
+
+# Create async engines: writes go to the primary, the read-only GET endpoints
+# use a replica's pool when DATABASE_READ_URL points elsewhere and otherwise
+# share the primary's pool rather than opening a second one to the same server
+engine = _create_engine(settings.database_url, settings.db_pool_size)
+write_engine = engine
+read_engine = (
+    write_engine
+    if settings.database_read_url == settings.database_url
+    else _create_engine(settings.database_read_url, settings.db_read_pool_size)
 )
 
-# Create async session factory
+# Create async session factories
 AsyncSessionLocal = async_sessionmaker(
-    engine,
+    write_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
     class_=AsyncSession,
     expire_on_commit=False,
     autocommit=False,
@@ -25,9 +69,12 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncSession:
+async def get_write_db() -> AsyncSession:
     """
-    Dependency to get database session.
+    Dependency to get a database session on the primary.
+    
+    FastAPI resolves the dependency once per request, so every use within
+    a request shares this session.
     
     Yields:
         AsyncSession: Database session
@@ -39,8 +86,26 @@ async def get_db() -> AsyncSession:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+# Default dependency for routes that write
+get_db = get_write_db
+
+
+async def get_read_db() -> AsyncSession:
+    """
+    Dependency to get a read-only database session.
+    
+    Runs as a single REPEATABLE READ transaction, so every query in the request
+    sees one snapshot (e.g. the list ETag token and the body it keys). Nothing
+    is committed; closing the session ends its transaction.
+    
+    Yields:
+        AsyncSession: Database session on the read engine
+    """
+    async with AsyncReadSessionLocal() as session:
+        await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        yield session
 
 
 async def init_db() -> None:
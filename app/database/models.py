@@ -1,4 +1,7 @@
-from sqlalchemy import Column, Integer, String, Boolean, Float, DateTime, JSON, Index, Text
+from sqlalchemy import (
+    BigInteger, Column, DDL, Integer, String, Boolean, Float, DateTime, Index, Text, event, text
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.database.base import Base
 
@@ -10,11 +13,11 @@ class Review(Base):
     """
     __tablename__ = "reviews"
     
-    # Primary identifier
-    id = Column(Integer, primary_key=True, index=True, unique=True)
+    # Primary identifier (the primary key constraint already provides the unique index)
+    id = Column(Integer, primary_key=True)
     
     # Listing information
-    listing_id = Column(String, nullable=True, index=True)
+    listing_id = Column(String, nullable=True)
     listing_name = Column(String, nullable=False, index=True)
     listing_location = Column(String, nullable=True)
     
@@ -26,7 +29,7 @@ class Review(Base):
     # Ratings
     rating = Column(Float, nullable=True)
     overall_rating = Column(Float, nullable=True)
-    category_ratings = Column(JSON, nullable=False, default=dict)  # Store as JSON: {"cleanliness": 10, ...}
+    category_ratings = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))  # Store as JSONB: {"cleanliness": 10, ...}
     
     # Review content
     public_review = Column(Text, nullable=True)
@@ -39,7 +42,7 @@ class Review(Base):
     stay_length = Column(Integer, nullable=True)
     
     # Approval status (merged from ReviewApproval for simplicity)
-    is_approved = Column(Boolean, default=False, nullable=False, index=True)
+    is_approved = Column(Boolean, default=False, nullable=False)
     approved_at = Column(DateTime(timezone=True), nullable=True)
     
     # Timestamps
@@ -47,13 +50,70 @@ class Review(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Indexes for common queries
+    # (newest-first ordering is part of the approved/listing indexes so Postgres can skip the sort)
     __table_args__ = (
-        Index('idx_review_listing_approved', 'listing_id', 'is_approved'),
         Index('idx_review_channel_status', 'channel', 'status'),
-        Index('idx_review_submitted_at', 'submitted_at'),
-        Index('idx_review_approved', 'is_approved'),
+        Index('idx_review_approved_submitted', 'is_approved', submitted_at.desc()),
+        # Keyset pages of one listing's reviews (ORDER BY submitted_at DESC, id DESC); as the
+        # leading column it also serves plain listing_id lookups, so listing_id has no own index
+        Index('ix_reviews_listing_recent', 'listing_id', submitted_at.desc(), id.desc()),
+        # Partial index for approved reviews of one listing; only approved rows are stored,
+        # and INCLUDE (id) lets ID-only approved lookups run as index-only scans
+        Index(
+            'ix_reviews_approved_recent', 'listing_id', submitted_at.desc(),
+            postgresql_include=['id'],
+            postgresql_where=text('is_approved = true')
+        ),
+        # GIN index for containment filters, e.g. category_ratings @> '{"cleanliness": 10}'
+        Index('idx_review_category_ratings_gin', 'category_ratings', postgresql_using='gin'),
     )
     
     def __repr__(self):
         return f"<Review(id={self.id}, listing_name={self.listing_name}, is_approved={self.is_approved})>"
 
+
+class ReviewsVersion(Base):
+    """
+    Single-row change counter for the reviews table, used for the list ETags.
+    
+    A statement-level trigger on reviews bumps it once inside every writing
+    transaction. The row lock it takes is held until commit, so concurrent
+    writers increment it in commit order and the version never repeats or
+    goes backwards, unlike timestamps or sequence values taken mid-transaction.
+    
+    The cost is that writes to reviews are serialized: a second writing
+    transaction waits on that row lock until the first commits or rolls back.
+    Writes here are manager approvals and seeding, so nothing contends on it;
+    a write-heavy workload would need another change signal.
+    
+    Requires PostgreSQL 13+ (pg_current_xact_id).
+    """
+    __tablename__ = "reviews_version"
+    
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+
+
+# Create the counter row and the trigger together with the reviews_version table on
+# fresh databases; existing ones get them from the Alembic migration 79ddb7672e87
+ReviewsVersion.__table__.add_is_dependent_on(Review.__table__)
+for _statement in (
+    "INSERT INTO reviews_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING",
+    """
+    CREATE OR REPLACE FUNCTION bump_reviews_version() RETURNS trigger AS $$
+    BEGIN
+        -- Once per transaction: skip if this transaction already bumped the row
+        UPDATE reviews_version SET version = version + 1
+        WHERE id = 1 AND xmin <> pg_current_xact_id()::xid;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS reviews_bump_version ON reviews",
+    """
+    CREATE TRIGGER reviews_bump_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON reviews
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_reviews_version()
+    """,
+):
+    event.listen(ReviewsVersion.__table__, "after_create", DDL(_statement))
@@ -1,12 +1,69 @@
 """Main FastAPI application"""
-from fastapi import FastAPI, Request
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.core.logging_config import setup_logging
+from app.core.logging_config import setup_logging, get_logger
 from app.middleware.request_logging import RequestLoggingMiddleware
-from app.middleware.rate_limiting import RateLimitingMiddleware
+from app.middleware.rate_limiting import RateLimiter, RateLimitingMiddleware
 from app.routes import reviews
-from app.database.base import init_db
+from app.services.hostaway import HostawayService
+from app.database.base import read_engine, write_engine, init_db
+
+
+logger = get_logger(__name__)
+
+
+async def _warm_mock_data_cache(data_path: str) -> None:
+    """
+    Parse the mock data file in a worker thread so seeding hits the parsed cache.
+    
+    Args:
+        data_path: Path to the mock data file
+    """
+    try:
+        await HostawayService(data_path).load_mock_data()
+    except (OSError, ValueError) as e:
+        logger.debug("Skipping mock data warmup: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize database and seed data on startup, release connections on shutdown"""
+    # Evict idle rate limiter entries in the background instead of on a request
+    cleanup_task = None
+    rate_limiter = getattr(app.state, "rate_limiter", None)
+    if rate_limiter is not None:
+        cleanup_task = asyncio.create_task(rate_limiter.run_periodic_cleanup())
+    
+    try:
+        # Create tables while the mock data file is read in the background
+        await asyncio.gather(
+            init_db(),
+            _warm_mock_data_cache(settings.mock_data_path)
+        )
+        from app.scripts.seed_database import seed_database
+        logger.info("Database initialized successfully")
+        
+        # Seed database with mock data if empty
+        await seed_database()
+        
+    except Exception as e:
+        logger.error("Failed to initialize database: %s", e, exc_info=True)
+    
+    yield
+    
+    if cleanup_task is not None:
+        cleanup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await cleanup_task
+    
+    if read_engine is write_engine:
+        await write_engine.dispose()
+    else:
+        await asyncio.gather(write_engine.dispose(), read_engine.dispose())
 
 
 def create_app() -> FastAPI:
@@ -20,51 +77,44 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title=settings.api_title,
         version=settings.api_version,
-        description="Backend API for Flex Living Reviews Dashboard"
+        description="Backend API for Flex Living Reviews Dashboard",
+        lifespan=lifespan
     )
     
-    # Add request logging middleware (before rate limiting to log all requests)
-    app.add_middleware(RequestLoggingMiddleware)
-    
     # Add rate limiting middleware (if enabled)
     if settings.rate_limit_enabled:
+        # Kept on app.state so the lifespan can run its cleanup task
+        app.state.rate_limiter = RateLimiter(
+            requests_per_minute=settings.rate_limit_per_minute,
+            requests_per_hour=settings.rate_limit_per_hour
+        )
         app.add_middleware(
             RateLimitingMiddleware,
-            requests_per_minute=settings.rate_limit_per_minute,
-            requests_per_hour=settings.rate_limit_per_hour,
+            rate_limiter=app.state.rate_limiter,
             exempt_paths=["/health", "/docs", "/redoc", "/openapi.json"]  # Exempt health and docs
         )
     
-    # Configure CORS
+    # Add request logging middleware (added last so it wraps rate limiting and logs all requests)
+    app.add_middleware(RequestLoggingMiddleware)
+    
+    # Configure CORS (a precompiled origin regex replaces the list scan when configured)
+    if settings.cors_origin_regex:
+        cors_origin_options = {"allow_origin_regex": settings.cors_origin_regex}
+    else:
+        cors_origin_options = {"allow_origins": settings.get_cors_origins()}
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.get_cors_origins(),
+        **cors_origin_options,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Lets browser clients read the keyset cursor of paginated review lists
+        expose_headers=["X-Next-Cursor"],
     )
     
     # Include routers
     app.include_router(reviews.router, prefix=settings.api_prefix)
     
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize database and seed data on startup"""
-        try:
-            await init_db()
-            from app.core.logging_config import get_logger
-            from app.scripts.seed_database import seed_database
-            logger = get_logger(__name__)
-            logger.info("Database initialized successfully")
-            
-            # Seed database with mock data if empty
-            await seed_database()
-            
-        except Exception as e:
-            from app.core.logging_config import get_logger
-            logger = get_logger(__name__)
-            logger.error(f"Failed to initialize database: {e}", exc_info=True)
-    
     return app
 
 
@@ -73,12 +123,15 @@ app = create_app()
 
 
 @app.get("/health", tags=["health"])
-async def health_check(request: Request):
+async def health_check():
     """Health check endpoint"""
-    from app.core.logging_config import get_logger
-    logger = get_logger(__name__)
-    request_id = getattr(request.state, "request_id", "unknown")
-    logger.debug(f"[{request_id}] Health check requested")
+    if logger.isEnabledFor(logging.DEBUG):
+        # Connection pool usage goes to the logs, not the public response, for
+        # spotting pool contention under load
+        logger.debug(
+            "Health check requested (write pool: %s; read pool: %s)",
+            write_engine.pool.status(), read_engine.pool.status()
+        )
     
     return {
         "status": "healthy",
@@ -1,10 +1,13 @@
-from collections import defaultdict
+import asyncio
+from math import ceil
 from time import time
-from typing import Callable
-from fastapi import Request, Response, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import status
+from pydantic_core import to_json
+from starlette.datastructures import MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.core.logging_config import get_logger
+from app.middleware.request_logging import get_client_ip
 
 
 logger = get_logger(__name__)
@@ -27,35 +30,36 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
         
-        # Store request timestamps per IP
-        # Format: {ip: [timestamps]}
-        self._request_history: dict[str, list[float]] = defaultdict(list)
-        self._cleanup_interval = 3600  # Clean up old entries every hour
-        self._last_cleanup = time()
+        # Refill rates in tokens per second
+        self._minute_rate = requests_per_minute / 60
+        self._hour_rate = requests_per_hour / 3600
+        
+        # Store token bucket state per IP
+        # Format: {ip: [minute_tokens, hour_tokens, last_refill_timestamp]}
+        self._state: dict[str, list[float]] = {}
+        self._cleanup_interval = 300  # Seconds between background cleanup passes
     
     def _cleanup_old_entries(self) -> None:
-        """Remove request timestamps older than 1 hour"""
-        current_time = time()
-        if current_time - self._last_cleanup < self._cleanup_interval:
-            return
-        
-        cutoff_time = current_time - 3600  # 1 hour ago
-        
-        # Clean up old entries
-        ips_to_remove = []
-        for ip, timestamps in self._request_history.items():
-            # Keep only timestamps from the last hour
-            filtered_timestamps = [ts for ts in timestamps if ts > cutoff_time]
-            if filtered_timestamps:
-                self._request_history[ip] = filtered_timestamps
-            else:
-                ips_to_remove.append(ip)
+        """Remove IPs idle for over an hour (their buckets are full again)"""
+        cutoff_time = time() - 3600  # 1 hour ago
         
         # Remove IPs with no recent requests
+        ips_to_remove = [
+            ip for ip, state in self._state.items()
+            if state[2] <= cutoff_time
+        ]
         for ip in ips_to_remove:
-            del self._request_history[ip]
+            del self._state[ip]
+    
+    async def run_periodic_cleanup(self) -> None:
+        """
+        Evict idle IPs every cleanup interval, off the request path.
         
-        self._last_cleanup = current_time
+        Runs until cancelled; started as a background task from the app lifespan.
+        """
+        while True:
+            await asyncio.sleep(self._cleanup_interval)
+            self._cleanup_old_entries()
     
     def is_allowed(self, identifier: str) -> tuple[bool, dict]:
         """
@@ -70,47 +74,52 @@ class RateLimiter:
         """
         current_time = time()
         
-        # Cleanup old entries periodically
-        self._cleanup_old_entries()
-        
-        # Get request history for this identifier
-        timestamps = self._request_history[identifier]
-        
-        # Filter timestamps within the time windows
-        one_minute_ago = current_time - 60
-        one_hour_ago = current_time - 3600
-        
-        recent_minute = [ts for ts in timestamps if ts > one_minute_ago]
-        recent_hour = [ts for ts in timestamps if ts > one_hour_ago]
+        # Get bucket state for this identifier (new IPs start with full buckets)
+        state = self._state.get(identifier)
+        if state is None:
+            state = self._state[identifier] = [
+                float(self.requests_per_minute),
+                float(self.requests_per_hour),
+                current_time
+            ]
+        
+        # Refill both buckets for the time elapsed since the last request
+        elapsed = current_time - state[2]
+        minute_tokens = min(self.requests_per_minute, state[0] + elapsed * self._minute_rate)
+        hour_tokens = min(self.requests_per_hour, state[1] + elapsed * self._hour_rate)
+        state[0] = minute_tokens
+        state[1] = hour_tokens
+        state[2] = current_time
         
         # Check limits
-        minute_limit_exceeded = len(recent_minute) >= self.requests_per_minute
-        hour_limit_exceeded = len(recent_hour) >= self.requests_per_hour
+        minute_limit_exceeded = minute_tokens < 1
+        hour_limit_exceeded = hour_tokens < 1
         
         if minute_limit_exceeded or hour_limit_exceeded:
-            # Calculate reset time
+            # Calculate time until the next token becomes available
             if minute_limit_exceeded:
-                reset_after = 60 - (current_time - recent_minute[0])
+                reset_after = (1 - minute_tokens) / self._minute_rate
                 limit = self.requests_per_minute
                 window = "minute"
             else:
-                reset_after = 3600 - (current_time - recent_hour[0])
+                reset_after = (1 - hour_tokens) / self._hour_rate
                 limit = self.requests_per_hour
                 window = "hour"
             
             return False, {
                 "limit": limit,
                 "remaining": 0,
-                "reset_after": int(reset_after),
+                "reset_after": ceil(reset_after),
                 "window": window
             }
         
-        # Add current request timestamp
-        timestamps.append(current_time)
+        # Consume a token from both buckets
+        state[0] = minute_tokens - 1
+        state[1] = hour_tokens - 1
         
         # Calculate remaining requests
-        remaining_minute = max(0, self.requests_per_minute - len(recent_minute) - 1)
-        remaining_hour = max(0, self.requests_per_hour - len(recent_hour) - 1)
+        remaining_minute = int(state[0])
+        remaining_hour = int(state[1])
         remaining = min(remaining_minute, remaining_hour)
         
         return True, {
@@ -121,10 +130,10 @@ class RateLimiter:
         }
 
 
-class RateLimitingMiddleware(BaseHTTPMiddleware):
+class RateLimitingMiddleware:
     """
     Rate limiting middleware - applies rate limits to all requests.
-    Reusable and configurable.
+    Reusable and configurable. Implemented as pure ASGI middleware.
     """
     
     def __init__(
@@ -132,7 +141,8 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
-        exempt_paths: list[str] | None = None
+        exempt_paths: list[str] | None = None,
+        rate_limiter: RateLimiter | None = None
     ):
         """
         Initialize rate limiting middleware.
@@ -142,46 +152,54 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
             requests_per_minute: Maximum requests per minute per IP
             requests_per_hour: Maximum requests per hour per IP
             exempt_paths: List of path prefixes to exempt from rate limiting (e.g., ["/health"])
+            rate_limiter: Shared limiter instance (e.g. one whose cleanup task the app
+                lifespan runs). A new one is built from the limits when omitted.
         """
-        super().__init__(app)
-        self.rate_limiter = RateLimiter(
+        self.app = app
+        self.rate_limiter = rate_limiter or RateLimiter(
             requests_per_minute=requests_per_minute,
             requests_per_hour=requests_per_hour
         )
         self.exempt_paths = exempt_paths or []
+        
+        # Precompute lookups: exact hits first, then a single C-level prefix match
+        self._exempt_exact: frozenset[str] = frozenset(self.exempt_paths)
+        self._exempt_prefixes: tuple[str, ...] = tuple(self.exempt_paths)
     
     def _is_exempt(self, path: str) -> bool:
         """Check if path is exempt from rate limiting"""
-        return any(path.startswith(exempt) for exempt in self.exempt_paths)
+        return path in self._exempt_exact or path.startswith(self._exempt_prefixes)
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with rate limiting"""
-        # Skip rate limiting for exempt paths
-        if self._is_exempt(request.url.path):
-            return await call_next(request)
+        # Only HTTP requests are rate limited; exempt paths pass straight through
+        if scope["type"] != "http" or self._is_exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
         
-        # Get client identifier (IP address)
-        client_ip = self._get_client_ip(request)
+        # Get client identifier (IP address) - shared with RequestLoggingMiddleware
+        client_ip = get_client_ip(scope, default="unknown")
         
         # Check rate limit
         is_allowed, rate_info = self.rate_limiter.is_allowed(client_ip)
         
         if not is_allowed:
-            request_id = getattr(request.state, "request_id", "unknown")
             logger.warning(
-                f"[{request_id}] Rate limit exceeded | "
-                f"IP: {client_ip} | "
-                f"Path: {request.url.path} | "
-                f"Limit: {rate_info['limit']}/{rate_info['window']}"
+                "Rate limit exceeded | IP: %s | Path: %s | Limit: %s/%s",
+                client_ip, scope["path"], rate_info["limit"], rate_info["window"]
             )
             
-            raise HTTPException(
+            # Serialize straight to bytes with pydantic-core instead of json.dumps
+            response = Response(
+                content=to_json({
+                    "detail": {
+                        "error": "Rate limit exceeded",
+                        "message": f"Too many requests. Limit: {rate_info['limit']} requests per {rate_info['window']}",
+                        "retry_after": rate_info["reset_after"]
+                    }
+                }),
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error": "Rate limit exceeded",
-                    "message": f"Too many requests. Limit: {rate_info['limit']} requests per {rate_info['window']}",
-                    "retry_after": rate_info["reset_after"]
-                },
+                media_type="application/json",
                 headers={
                     "X-RateLimit-Limit": str(rate_info["limit"]),
                     "X-RateLimit-Remaining": str(rate_info["remaining"]),
@@ -189,42 +207,17 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
                     "Retry-After": str(rate_info["reset_after"])
                 }
             )
+            await response(scope, receive, send)
+            return
         
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers to response
-        response.headers["X-RateLimit-Limit"] = str(rate_info["limit"])
-        response.headers["X-RateLimit-Remaining"] = str(rate_info["remaining"])
-        response.headers["X-RateLimit-Reset-After"] = str(rate_info["reset_after"])
-        
-        return response
-    
-    @staticmethod
-    def _get_client_ip(request: Request) -> str:
-        """
-        Extract client IP address from request.
-        Reuses logic from RequestLoggingMiddleware (DRY principle).
-        
-        Args:
-            request: FastAPI request object
-            
-        Returns:
-            Client IP address
-        """
-        # Check for forwarded IP (from proxy/load balancer)
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        # Check for real IP header
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip.strip()
-        
-        # Fall back to direct client IP
-        if request.client:
-            return request.client.host
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            # Add rate limit headers to response
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(rate_info["limit"])
+                headers["X-RateLimit-Remaining"] = str(rate_info["remaining"])
+                headers["X-RateLimit-Reset-After"] = str(rate_info["reset_after"])
+            await send(message)
         
-        return "unknown"
-
+        # Process request
+        await self.app(scope, receive, send_with_rate_limit_headers)
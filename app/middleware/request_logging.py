@@ -1,102 +1,118 @@
+import logging
 import time
-import uuid
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from app.core.logging_config import get_logger
+import secrets
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.logging_config import get_logger, request_id_var
 
 
 logger = get_logger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+def get_client_ip(scope: Scope, default: str = "Unknown") -> str:
+    """
+    Extract client IP address from the ASGI scope.
+    Handles proxies and load balancers.
+    
+    Walks the raw header list once, returning as soon as X-Forwarded-For is
+    found, and decodes only the matched value.
+    
+    Args:
+        scope: ASGI connection scope
+        default: Value returned when no client address is available
+        
+    Returns:
+        Client IP address
+    """
+    real_ip = None
+    for key, value in scope["headers"]:
+        if key == b"x-forwarded-for":
+            # Check for forwarded IP (from proxy/load balancer)
+            forwarded_for = value.decode("latin-1")
+            if forwarded_for:
+                # Take the first IP in the chain
+                return forwarded_for.split(",")[0].strip()
+        elif key == b"x-real-ip" and real_ip is None:
+            real_ip = value
+    
+    # Check for real IP header
+    if real_ip:
+        return real_ip.decode("latin-1").strip()
+    
+    # Fall back to direct client IP
+    client = scope.get("client")
+    if client:
+        return client[0]
+    
+    return default
+
+
+class RequestLoggingMiddleware:
     """Middleware to log all incoming HTTP requests with detailed information"""
     
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Generate unique request ID for tracing
-        request_id = str(uuid.uuid4())[:8]
+        request_id = secrets.token_hex(4)
         
-        # Extract client information
-        client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("user-agent", "Unknown")
-        referer = request.headers.get("referer", "N/A")
+        method = scope["method"]
+        path = scope["path"]
+        
+        # Expose request ID to handlers and log records via the context variable
+        token = request_id_var.set(request_id)
         
         # Start timer
         start_time = time.time()
         
-        # Log request
-        logger.info(
-            f"[{request_id}] {request.method} {request.url.path} | "
-            f"IP: {client_ip} | "
-            f"User-Agent: {user_agent[:50]}"
-        )
+        # Log request (client information is only extracted when INFO is enabled)
+        if logger.isEnabledFor(logging.INFO):
+            user_agent = "Unknown"
+            for key, value in scope["headers"]:
+                if key == b"user-agent":
+                    user_agent = value.decode("latin-1")
+                    break
+            logger.info(
+                "%s %s | IP: %s | User-Agent: %s",
+                method, path, get_client_ip(scope), user_agent[:50]
+            )
+        
+        status_code = 500
         
-        # Add request ID to request state for use in handlers
-        request.state.request_id = request_id
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
         
         try:
             # Process request
-            response = await call_next(request)
-            
-            # Calculate processing time
-            process_time = time.time() - start_time
-            
-            # Log response
-            logger.info(
-                f"[{request_id}] {request.method} {request.url.path} | "
-                f"Status: {response.status_code} | "
-                f"Time: {process_time:.3f}s | "
-                f"IP: {client_ip}"
-            )
-            
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            
-            return response
-            
+            await self.app(scope, receive, send_with_request_id)
         except Exception as e:
             # Log errors
             process_time = time.time() - start_time
             logger.error(
-                f"[{request_id}] {request.method} {request.url.path} | "
-                f"Error: {str(e)} | "
-                f"Time: {process_time:.3f}s | "
-                f"IP: {client_ip}",
+                "%s %s | Error: %s | Time: %.3fs | IP: %s",
+                method, path, e, process_time, get_client_ip(scope),
                 exc_info=True
             )
             raise
-    
-    @staticmethod
-    def _get_client_ip(request: Request) -> str:
-        """
-        Extract client IP address from request.
-        Handles proxies and load balancers.
-        
-        Args:
-            request: FastAPI request object
-            
-        Returns:
-            Client IP address
-        """
-        # Check for forwarded IP (from proxy/load balancer)
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            # Take the first IP in the chain
-            return forwarded_for.split(",")[0].strip()
-        
-        # Check for real IP header
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip.strip()
-        
-        # Fall back to direct client IP
-        if request.client:
-            return request.client.host
-        
-        return "Unknown"
-
+        else:
+            # Log response
+            if logger.isEnabledFor(logging.INFO):
+                # Calculate processing time
+                process_time = time.time() - start_time
+                logger.info(
+                    "%s %s | Status: %s | Time: %.3fs | IP: %s",
+                    method, path, status_code, process_time, get_client_ip(scope)
+                )
+        finally:
+            request_id_var.reset(token)
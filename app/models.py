@@ -1,13 +1,19 @@
 """Pydantic models for review data structures"""
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Annotated, Optional, Dict, List
 from pydantic import BaseModel, Field, field_validator
+from typing_extensions import TypedDict
 
 
-class ReviewCategory(BaseModel):
-    """Individual review category rating"""
+class ReviewCategory(TypedDict):
+    """
+    Individual review category rating.
+    
+    A TypedDict rather than a model: pydantic still validates the fields,
+    but each category stays a plain dict instead of a model instance.
+    """
     category: str
-    rating: int = Field(..., ge=0, le=10)
+    rating: Annotated[int, Field(ge=0, le=10)]
 
 
 class HostawayReviewRaw(BaseModel):
@@ -79,27 +85,26 @@ class NormalizedReview(BaseModel):
     def model_post_init(self, __context) -> None:
         """Set overallRating as alias for rating and ensure date is set"""
         # Sync rating and overallRating
-        if self.rating is not None and self.overallRating is None:
-            object.__setattr__(self, 'overallRating', self.rating)
-        elif self.overallRating is not None and self.rating is None:
-            object.__setattr__(self, 'rating', self.overallRating)
+        rating, overall_rating = self.rating, self.overallRating
+        if rating is None and overall_rating is not None:
+            object.__setattr__(self, 'rating', overall_rating)
+        elif overall_rating is None and rating is not None:
+            object.__setattr__(self, 'overallRating', rating)
         
         # Ensure date is set from submittedAt if not provided
-        if self.date is None and self.submittedAt:
+        submitted_at = self.submittedAt
+        if self.date is None and submitted_at:
+            # Python 3.10's fromisoformat doesn't accept the Z suffix
+            # (e.g., "2024-11-05T07:55:00Z"), so swap it for an explicit offset
+            if submitted_at[-1] == 'Z':
+                submitted_at = submitted_at[:-1] + '+00:00'
             try:
-                # Handle ISO 8601 format with Z suffix (e.g., "2024-11-05T07:55:00Z")
-                if self.submittedAt.endswith('Z'):
-                    # Replace Z with +00:00 for fromisoformat
-                    dt_str = self.submittedAt.replace('Z', '+00:00')
-                    dt = datetime.fromisoformat(dt_str)
-                elif 'T' in self.submittedAt:
-                    # ISO format without Z
-                    dt = datetime.fromisoformat(self.submittedAt)
-                else:
-                    # Fall back to Hostaway format
-                    dt = datetime.strptime(self.submittedAt, "%Y-%m-%d %H:%M:%S")
-                object.__setattr__(self, 'date', dt)
-            except (ValueError, AttributeError) as e:
-                # Log error but don't fail - date will remain None
-                pass
-
+                # Handles ISO 8601 as well as the Hostaway "YYYY-MM-DD HH:MM:SS" format
+                dt = datetime.fromisoformat(submitted_at)
+            except ValueError:
+                try:
+                    dt = datetime.strptime(submitted_at, "%Y-%m-%d %H:%M:%S")
+                except ValueError:
+                    # Don't fail - date will remain None
+                    return
+            object.__setattr__(self, 'date', dt)
@@ -1,17 +1,82 @@
-from fastapi import APIRouter, HTTPException, Request, Depends, status
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from pydantic import BaseModel, Field
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, Field, TypeAdapter
 from app.models import NormalizedReview
+from app.database.models import Review
 from app.services.review_repository import ReviewRepository
 from app.services.review_approval import ReviewApprovalService
-from app.database.base import get_db
+from app.database.base import get_db, get_read_db
+from app.core.cache import TTLCache
 from app.core.logging_config import get_logger
 
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 logger = get_logger(__name__)
 
+# Cache-Control for the review lists; both are revalidated cheaply via ETag
+_HOSTAWAY_CACHE_CONTROL = "private, no-cache"  # Manager view with private notes, always revalidate
+_APPROVED_CACHE_CONTROL = "public, max-age=30"
+
+# Serialized review list bodies keyed by (endpoint, filter, table state token).
+# Every committed write bumps the token (reviews_version), and get_read_db reads the
+# token and the body from one snapshot, so a key never maps to another version's body.
+_review_list_cache = TTLCache(maxsize=64, ttl=60)
+
+# Serializes a whole review list to JSON bytes in one pydantic-core call
+_REVIEW_LIST_ADAPTER = TypeAdapter(List[NormalizedReview])
+
+# Keyset pages of the Hostaway list: default and largest accepted page size
+_DEFAULT_PAGE_SIZE = 100
+_MAX_PAGE_SIZE = 500
+
+# Keyset cursors carry submitted_at as whole microseconds since the epoch, so they
+# round-trip exactly and stay URL-safe
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header already holds the current ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _encode_cursor(review: Review) -> str:
+    """Build the cursor that continues a keyset page after the given review"""
+    delta = review.submitted_at - _EPOCH
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return f"{micros}_{review.id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Parse a cursor from _encode_cursor back into (submitted_at, id).
+    
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        micros, review_id = cursor.split("_")
+        return _EPOCH + timedelta(microseconds=int(micros)), int(review_id)
+    except (ValueError, OverflowError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {cursor}"
+        ) from e
+
+
+def _review_list_response(body: bytes, headers: dict) -> Response:
+    """
+    Wrap a serialized review list in a JSON response.
+    
+    The reviews are built from our own table, so FastAPI's response_model
+    validation pass is skipped; response_model stays on the routes for the docs.
+    """
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 class ApprovalRequest(BaseModel):
     """
@@ -37,53 +102,139 @@ class BulkApprovalRequest(BaseModel):
     is_approved: bool = Field(..., description="Approval status to apply to all reviews", example=True)
 
 
+class ApprovalResponse(BaseModel):
+    """
+    Response model for single review approval toggle.
+    
+    Attributes:
+        success: Whether the operation was successful
+        review_id: ID of the updated review
+        is_approved: The new approval status
+        message: Human-readable confirmation message
+    """
+    success: bool
+    review_id: int
+    is_approved: bool
+    message: str
+
+
+class BulkApprovalResponse(BaseModel):
+    """
+    Response model for bulk review approval toggle.
+    
+    Attributes:
+        success: Whether the operation was successful
+        updated_count: Number of reviews successfully updated
+        is_approved: The approval status that was applied
+        message: Human-readable confirmation message with count
+    """
+    success: bool
+    updated_count: int
+    is_approved: bool
+    message: str
+
+
 @router.get(
     "/hostaway",
     response_model=List[NormalizedReview],
     summary="Get Hostaway reviews",
-    description="Fetch all Hostaway reviews from database with approval status"
+    description=(
+        "Fetch all Hostaway reviews from database with approval status. Passing "
+        "`limit`, `cursor` or `listing_id` returns one keyset page instead, newest "
+        "first; the `X-Next-Cursor` response header holds the cursor of the next page."
+    ),
+    responses={304: {"description": "Reviews unchanged since the ETag in If-None-Match"}}
 )
 async def get_hostaway_reviews(
     request: Request,
-    db: AsyncSession = Depends(get_db)
+    listing_id: Optional[str] = Query(None, description="Only page through this listing's reviews"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=_MAX_PAGE_SIZE,
+        description=f"Page size (default {_DEFAULT_PAGE_SIZE})"
+    ),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value of the previous page"),
+    db: AsyncSession = Depends(get_read_db)
 ) -> List[NormalizedReview]:
     """
-    Retrieve all Hostaway reviews from database.
+    Retrieve all Hostaway reviews from database, or one keyset page of them.
     
     Returns:
         List of normalized review objects with approval status
         
     Raises:
-        HTTPException: If data cannot be loaded or processed
+        HTTPException: If the cursor is malformed (400), or data cannot be loaded or processed
     """
-    request_id = getattr(request.state, "request_id", "unknown")
+    paginated = listing_id is not None or limit is not None or cursor is not None
+    after = _decode_cursor(cursor) if cursor is not None else None
     
     try:
-        logger.info(f"[{request_id}] Fetching Hostaway reviews from database")
+        # Answer conditional requests without loading or serializing the reviews
+        state_token = await ReviewRepository.get_state_token(db)
+        etag = f'W/"{state_token}"'
+        cache_headers = {"ETag": etag, "Cache-Control": _HOSTAWAY_CACHE_CONTROL}
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
         
-        # Load reviews from database
-        reviews = await ReviewRepository.get_all(db)
-        logger.debug(f"[{request_id}] Loaded {len(reviews)} reviews from database")
+        if paginated:
+            return await _hostaway_review_page(
+                db, listing_id, after, limit or _DEFAULT_PAGE_SIZE, cache_headers
+            )
         
-        # Convert to NormalizedReview format
-        normalized_reviews = [
-            ReviewRepository.to_normalized_review(review)
-            for review in reviews
-        ]
+        # Reuse the serialized body while the table is unchanged
+        cache_key = ("hostaway", state_token)
+        body = _review_list_cache.get(cache_key)
+        if body is None:
+            logger.info("Fetching Hostaway reviews from database")
+            
+            # Load reviews from database, already in NormalizedReview format
+            normalized_reviews = await ReviewRepository.get_all_normalized(db)
+            
+            logger.info("Successfully retrieved %d reviews", len(normalized_reviews))
+            body = _REVIEW_LIST_ADAPTER.dump_json(normalized_reviews)
+            _review_list_cache.set(cache_key, body)
         
-        logger.info(f"[{request_id}] Successfully retrieved {len(normalized_reviews)} reviews")
-        return normalized_reviews
+        return _review_list_response(body, cache_headers)
         
     except Exception as e:
-        logger.error(f"[{request_id}] Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
         ) from e
 
 
+async def _hostaway_review_page(
+    db: AsyncSession,
+    listing_id: Optional[str],
+    after: Optional[Tuple[datetime, int]],
+    page_size: int,
+    headers: dict
+) -> Response:
+    """
+    Serialize one keyset page of reviews, newest first.
+    
+    One extra row is fetched to tell whether another page follows; only then is
+    X-Next-Cursor set. Pages are small and keyed by cursor, so they skip the
+    list body cache.
+    """
+    if listing_id is not None:
+        reviews = await ReviewRepository.get_by_listing(db, listing_id, after, page_size + 1)
+    else:
+        reviews = await ReviewRepository.get_all(db, after, page_size + 1)
+    
+    if len(reviews) > page_size:
+        reviews = reviews[:page_size]
+        headers = {**headers, "X-Next-Cursor": _encode_cursor(reviews[-1])}
+    
+    body = _REVIEW_LIST_ADAPTER.dump_json(
+        [ReviewRepository.to_normalized_review(review) for review in reviews]
+    )
+    return _review_list_response(body, headers)
+
+
 @router.patch(
     "/approve",
+    response_model=ApprovalResponse,
     summary="Toggle review approval",
     description="""
     Approve or reject a single review for public display.
@@ -119,7 +270,6 @@ async def get_hostaway_reviews(
     tags=["reviews", "approval"]
 )
 async def toggle_review_approval(
-    request: Request,
     approval_request: ApprovalRequest,
     db: AsyncSession = Depends(get_db)
 ):
@@ -145,8 +295,6 @@ async def toggle_review_approval(
     - Setting `is_approved` to `true` sets the `approved_at` timestamp
     - Setting `is_approved` to `false` clears the `approved_at` timestamp
     """
-    request_id = getattr(request.state, "request_id", "unknown")
-    
     try:
         approval = await ReviewApprovalService.set_approval_status(
             db=db,
@@ -155,8 +303,8 @@ async def toggle_review_approval(
         )
         
         logger.info(
-            f"[{request_id}] Review {approval_request.review_id} "
-            f"approval set to {approval_request.is_approved}"
+            "Review %s approval set to %s",
+            approval_request.review_id, approval_request.is_approved
         )
         
         return {
@@ -167,7 +315,7 @@ async def toggle_review_approval(
         }
         
     except Exception as e:
-        logger.error(f"[{request_id}] Error updating approval: {e}", exc_info=True)
+        logger.error("Error updating approval: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error updating approval status: {str(e)}"
@@ -176,6 +324,7 @@ async def toggle_review_approval(
 
 @router.patch(
     "/approve/bulk",
+    response_model=BulkApprovalResponse,
     summary="Bulk toggle review approvals",
     description="""
     Approve or reject multiple reviews at once.
@@ -216,7 +365,6 @@ async def toggle_review_approval(
     tags=["reviews", "approval", "bulk"]
 )
 async def bulk_toggle_review_approval(
-    request: Request,
     bulk_request: BulkApprovalRequest,
     db: AsyncSession = Depends(get_db)
 ):
@@ -243,8 +391,6 @@ async def bulk_toggle_review_approval(
     - The operation is atomic - either all updates succeed or none do
     - More efficient than multiple individual `/approve` calls
     """
-    request_id = getattr(request.state, "request_id", "unknown")
-    
     try:
         count = await ReviewApprovalService.bulk_set_approval_status(
             db=db,
@@ -253,7 +399,7 @@ async def bulk_toggle_review_approval(
         )
         
         logger.info(
-            f"[{request_id}] Bulk approval: {count} reviews set to {bulk_request.is_approved}"
+            "Bulk approval: %d reviews set to %s", count, bulk_request.is_approved
         )
         
         return {
@@ -264,7 +410,7 @@ async def bulk_toggle_review_approval(
         }
         
     except Exception as e:
-        logger.error(f"[{request_id}] Error bulk updating approvals: {e}", exc_info=True)
+        logger.error("Error bulk updating approvals: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error bulk updating approval status: {str(e)}"
@@ -328,12 +474,13 @@ async def bulk_toggle_review_approval(
     """,
     response_description="List of approved reviews for public display",
     status_code=200,
-    tags=["reviews", "public"]
+    tags=["reviews", "public"],
+    responses={304: {"description": "Reviews unchanged since the ETag in If-None-Match"}}
 )
 async def get_approved_reviews(
     request: Request,
     listing_id: str = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ) -> List[NormalizedReview]:
     """
     Get approved reviews for public display.
@@ -354,23 +501,31 @@ async def get_approved_reviews(
     - Use this endpoint for public-facing pages
     - Private notes may be included - filter them out on the frontend for public display
     - Empty array is returned if no approved reviews exist (or match the listing filter)
+    - Responses carry an `ETag`; send it back in `If-None-Match` to get `304 Not Modified` while nothing changed
     """
-    request_id = getattr(request.state, "request_id", "unknown")
-    
     try:
-        approved_reviews = await ReviewRepository.get_approved(db, listing_id)
-        
-        normalized_reviews = [
-            ReviewRepository.to_normalized_review(review)
-            for review in approved_reviews
-        ]
+        # Answer conditional requests without loading or serializing the reviews
+        state_token = await ReviewRepository.get_state_token(db)
+        etag = f'W/"{state_token}"'
+        cache_headers = {"ETag": etag, "Cache-Control": _APPROVED_CACHE_CONTROL}
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
         
-        logger.info(f"[{request_id}] Retrieved {len(normalized_reviews)} approved reviews")
+        # Reuse the serialized body while the table is unchanged
+        cache_key = ("approved", listing_id, state_token)
+        body = _review_list_cache.get(cache_key)
+        if body is None:
+            normalized_reviews = await ReviewRepository.get_approved_normalized(db, listing_id)
+            
+            logger.info("Retrieved %d approved reviews", len(normalized_reviews))
+            
+            body = _REVIEW_LIST_ADAPTER.dump_json(normalized_reviews)
+            _review_list_cache.set(cache_key, body)
         
-        return normalized_reviews
+        return _review_list_response(body, cache_headers)
         
     except Exception as e:
-        logger.error(f"[{request_id}] Error getting approved reviews: {e}", exc_info=True)
+        logger.error("Error getting approved reviews: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving approved reviews: {str(e)}"
@@ -22,9 +22,9 @@ async def seed_database() -> None:
     async with AsyncSessionLocal() as db:
         try:
             # Check if reviews already exist
-            existing_reviews = await ReviewRepository.get_all(db)
-            if existing_reviews:
-                logger.info(f"Database already contains {len(existing_reviews)} reviews. Skipping seed.")
+            # (EXISTS stops at the first row instead of loading the whole table)
+            if await ReviewRepository.has_any(db):
+                logger.info("Database already contains reviews. Skipping seed.")
                 return
             
             logger.info("Starting database seed...")
@@ -33,16 +33,13 @@ async def seed_database() -> None:
             hostaway_service = HostawayService()
             normalizer = ReviewNormalizer()
             
-            raw_reviews = hostaway_service.get_reviews()
+            raw_reviews = await hostaway_service.get_reviews()
             logger.info(f"Loaded {len(raw_reviews)} raw reviews from mock data")
             
-            # Normalize reviews
-            normalized_reviews = [
-                normalizer.normalize_hostaway_review(review)
-                for review in raw_reviews
-            ]
+            # Normalize reviews (validated as one batch)
+            normalized_reviews = normalizer.normalize_hostaway_reviews(raw_reviews)
             
-            # Save to database
+            # Save to database (large loads switch to COPY inside the repository)
             count = await ReviewRepository.bulk_create_or_update(db, normalized_reviews)
             
             logger.info(f"Successfully seeded {count} reviews into database")
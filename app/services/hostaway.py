@@ -1,10 +1,28 @@
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import List
+import anyio.to_thread
+from pydantic import ValidationError
 from app.models import HostawayReviewRaw, HostawayApiResponse
 from app.core.config import settings
 
 
+@lru_cache(maxsize=8)
+def _parse_mock_data(data_path: Path, mtime_ns: int) -> HostawayApiResponse:
+    """
+    Parse and validate a mock data file, cached per path and modification time.
+    
+    Args:
+        data_path: Path to the mock data file
+        mtime_ns: File modification time; a changed file gets a fresh cache entry
+        
+    Returns:
+        Validated Hostaway API response
+    """
+    # Parse and validate in one pass inside pydantic-core
+    return HostawayApiResponse.model_validate_json(data_path.read_bytes())
+
+
 class HostawayService:
     """Service responsible for loading and managing Hostaway review data"""
     
@@ -17,10 +35,25 @@ class HostawayService:
         """
         self.data_path = Path(data_path or settings.mock_data_path)
     
-    def load_mock_data(self) -> List[HostawayReviewRaw]:
+    async def load_mock_data(self) -> List[HostawayReviewRaw]:
         """
         Load mock review data from JSON file.
         
+        File I/O and parsing run in a worker thread so the event loop is not blocked.
+        
+        Returns:
+            List of raw Hostaway review objects
+            
+        Raises:
+            FileNotFoundError: If mock data file doesn't exist
+            ValueError: If data cannot be parsed or validated
+        """
+        return await anyio.to_thread.run_sync(self._load_mock_data_sync)
+    
+    def _load_mock_data_sync(self) -> List[HostawayReviewRaw]:
+        """
+        Load mock review data from JSON file (blocking).
+        
         Returns:
             List of raw Hostaway review objects
             
@@ -35,28 +68,28 @@ class HostawayService:
             )
         
         try:
-            with open(self.data_path, "r", encoding="utf-8") as file:
-                data = json.load(file)
-            
-            # Validate and parse API response structure
-            api_response = HostawayApiResponse(**data)
+            # Validate and parse API response structure (reused until the file changes)
+            api_response = _parse_mock_data(self.data_path, self.data_path.stat().st_mtime_ns)
             
             if api_response.status != "success":
                 raise ValueError(f"API response status is not 'success': {api_response.status}")
             
-            return api_response.result
+            # Copy so callers can't mutate the cached list
+            return list(api_response.result)
             
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in mock data file: {e}") from e
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise ValueError(f"Invalid JSON in mock data file: {e}") from e
+            raise ValueError(f"Error loading mock data: {e}") from e
         except Exception as e:
             raise ValueError(f"Error loading mock data: {e}") from e
     
-    def get_reviews(self) -> List[HostawayReviewRaw]:
+    async def get_reviews(self) -> List[HostawayReviewRaw]:
         """
         Get all reviews from Hostaway (currently using mock data).
         
         Returns:
             List of raw Hostaway review objects
         """
-        return self.load_mock_data()
+        return await self.load_mock_data()
 
@@ -1,8 +1,31 @@
+import sys
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List
+from pydantic import TypeAdapter
 from app.models import HostawayReviewRaw, NormalizedReview, ReviewCategory
 
 
+_HOSTAWAY = sys.intern("hostaway")
+
+# Interned values of the low-cardinality fields (channel, type, status), so every
+# normalized review shares one string object per distinct value
+_intern_cache: dict[str, str] = {}
+
+
+def _intern(value: str | None) -> str | None:
+    """Return the shared interned copy of a channel, type or status string"""
+    if value is None:
+        return None
+    interned = _intern_cache.get(value)
+    if interned is None:
+        interned = _intern_cache[value] = sys.intern(value)
+    return interned
+
+
+# Validates a whole batch of normalized reviews in one pydantic-core call
+_NORMALIZED_REVIEWS_ADAPTER = TypeAdapter(List[NormalizedReview])
+
+
 class ReviewNormalizer:
     """Service responsible for normalizing review data from various sources"""
     
@@ -17,6 +40,38 @@ class ReviewNormalizer:
         Returns:
             Normalized review object matching frontend HostawayReview type
         """
+        return NormalizedReview(**ReviewNormalizer._normalized_fields(raw_review))
+    
+    @staticmethod
+    def normalize_hostaway_reviews(raw_reviews: List[HostawayReviewRaw]) -> List[NormalizedReview]:
+        """
+        Normalize a batch of Hostaway reviews.
+        
+        Builds plain field dicts per review and validates the whole list in a
+        single TypeAdapter call instead of constructing each model separately.
+        
+        Args:
+            raw_reviews: Raw Hostaway review data
+            
+        Returns:
+            Normalized review objects, in input order
+        """
+        return _NORMALIZED_REVIEWS_ADAPTER.validate_python([
+            ReviewNormalizer._normalized_fields(raw_review)
+            for raw_review in raw_reviews
+        ])
+    
+    @staticmethod
+    def _normalized_fields(raw_review: HostawayReviewRaw) -> Dict[str, Any]:
+        """
+        Map a raw Hostaway review onto NormalizedReview field values.
+        
+        Args:
+            raw_review: Raw Hostaway review data
+            
+        Returns:
+            Dictionary keyed by NormalizedReview field name
+        """
         # Convert reviewCategory list to dictionary
         category_ratings = ReviewNormalizer._extract_category_ratings(
             raw_review.reviewCategory
@@ -28,31 +83,27 @@ class ReviewNormalizer:
             category_ratings
         )
         
-        # Normalize submittedAt to ISO 8601 format
-        submitted_at_iso = ReviewNormalizer._normalize_datetime_to_iso(raw_review.submittedAt)
-        
-        # Determine channel (use provided or default to "hostaway")
-        channel = raw_review.channel or "hostaway"
-        
-        return NormalizedReview(
-            id=raw_review.id,
-            listingId=raw_review.listingId,
-            listingName=raw_review.listingName,
-            listingLocation=raw_review.listingLocation,
-            channel=channel,
-            type=raw_review.type,
-            status=raw_review.status,
-            rating=overall_rating,
-            overallRating=overall_rating,
-            categoryRatings=category_ratings,
-            publicReview=raw_review.publicReview,
-            privateNote=raw_review.privateNote,
-            guestName=raw_review.guestName,
-            submittedAt=submitted_at_iso,
-            stayDate=raw_review.stayDate,
-            stayLength=raw_review.stayLength,
-            isApproved=False  # Default to False, managed by frontend/dashboard
-        )
+        return {
+            "id": raw_review.id,
+            "listingId": raw_review.listingId,
+            "listingName": raw_review.listingName,
+            "listingLocation": raw_review.listingLocation,
+            # Determine channel (use provided or default to "hostaway")
+            "channel": _intern(raw_review.channel) or _HOSTAWAY,
+            "type": _intern(raw_review.type),
+            "status": _intern(raw_review.status),
+            "rating": overall_rating,
+            "overallRating": overall_rating,
+            "categoryRatings": category_ratings,
+            "publicReview": raw_review.publicReview,
+            "privateNote": raw_review.privateNote,
+            "guestName": raw_review.guestName,
+            # Normalize submittedAt to ISO 8601 format
+            "submittedAt": ReviewNormalizer._normalize_datetime_to_iso(raw_review.submittedAt),
+            "stayDate": raw_review.stayDate,
+            "stayLength": raw_review.stayLength,
+            "isApproved": False  # Default to False, managed by frontend/dashboard
+        }
     
     @staticmethod
     def _extract_category_ratings(categories: List[ReviewCategory]) -> Dict[str, int]:
@@ -60,13 +111,13 @@ class ReviewNormalizer:
         Extract category ratings into a dictionary.
         
         Args:
-            categories: List of ReviewCategory objects
+            categories: List of ReviewCategory dicts
             
         Returns:
             Dictionary mapping category names to ratings
         """
         return {
-            category.category: category.rating
+            category["category"]: category["rating"]
             for category in categories
         }
     
@@ -132,6 +183,16 @@ class ReviewNormalizer:
         Returns:
             ISO 8601 formatted string (e.g., "2024-08-21T22:45:14Z")
         """
+        # Fast path for the Hostaway "YYYY-MM-DD HH:MM:SS" shape: rewrite the
+        # separator and append Z with slicing instead of a strptime/strftime round-trip
+        if (
+            len(date_string) == 19
+            and date_string[10] == ' '
+            and date_string[4] == date_string[7] == '-'
+            and date_string[13] == date_string[16] == ':'
+        ):
+            return date_string[:10] + 'T' + date_string[11:] + 'Z'
+        
         try:
             # If already ISO format, return as-is (with Z if missing)
             if 'T' in date_string:
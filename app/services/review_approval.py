@@ -5,6 +5,9 @@ from app.services.review_repository import ReviewRepository
 from app.core.logging_config import get_logger
 
 
+__all__ = ["ReviewApprovalService"]
+
+
 logger = get_logger(__name__)
 
 
@@ -26,8 +29,7 @@ class ReviewApprovalService:
         Returns:
             Approval status (True/False) or None if not found
         """
-        review = await ReviewRepository.get_by_id(db, review_id)
-        return review.is_approved if review else None
+        return await ReviewRepository.get_approval_status(db, review_id)
     
     @staticmethod
     async def get_bulk_approval_status(
@@ -47,8 +49,7 @@ class ReviewApprovalService:
         if not review_ids:
             return {}
         
-        reviews = await ReviewRepository.get_all(db)
-        return {review.id: review.is_approved for review in reviews if review.id in review_ids}
+        return await ReviewRepository.get_approval_map(db, list(review_ids))
     
     @staticmethod
     async def set_approval_status(
@@ -72,9 +73,9 @@ class ReviewApprovalService:
         review = await ReviewRepository.set_approval_status(db, review_id, is_approved)
         
         if review:
-            logger.info(f"Set approval status for review {review_id}: {is_approved}")
+            logger.info("Set approval status for review %s: %s", review_id, is_approved)
         else:
-            logger.warning(f"Review {review_id} not found")
+            logger.warning("Review %s not found", review_id)
         
         return review
     
@@ -98,7 +99,7 @@ class ReviewApprovalService:
             Number of reviews updated
         """
         count = await ReviewRepository.bulk_set_approval_status(db, review_ids, is_approved)
-        logger.info(f"Bulk set approval status for {count} reviews: {is_approved}")
+        logger.info("Bulk set approval status for %d reviews: %s", count, is_approved)
         return count
     
     @staticmethod
@@ -116,5 +117,4 @@ class ReviewApprovalService:
         Returns:
             List of approved review IDs
         """
-        approved_reviews = await ReviewRepository.get_approved(db, listing_id)
-        return [review.id for review in approved_reviews]
+        return await ReviewRepository.get_approved_ids(db, listing_id)
@@ -1,34 +1,265 @@
 """Review repository service - handles database operations for reviews"""
+import json
+import sys
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func, bindparam, lambda_stmt, any_, case, tuple_, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timezone
-from app.database.models import Review
+from app.database.models import Review, ReviewsVersion
 from app.models import NormalizedReview
 from app.core.logging_config import get_logger
 
 
 logger = get_logger(__name__)
 
+_UTC = timezone.utc
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+# Columns projected straight into NormalizedReview fields, so list endpoints
+# skip ORM hydration and the per-row to_normalized_review conversion
+_NORMALIZED_REVIEW_COLUMNS = (
+    Review.id.label("id"),
+    Review.listing_id.label("listingId"),
+    Review.listing_name.label("listingName"),
+    Review.listing_location.label("listingLocation"),
+    Review.channel.label("channel"),
+    Review.type.label("type"),
+    Review.status.label("status"),
+    func.coalesce(Review.rating, Review.overall_rating).label("rating"),
+    func.coalesce(Review.overall_rating, Review.rating).label("overallRating"),
+    Review.category_ratings.label("categoryRatings"),
+    Review.public_review.label("publicReview"),
+    Review.private_note.label("privateNote"),
+    Review.guest_name.label("guestName"),
+    # ISO 8601 in UTC with Z suffix (e.g., "2024-11-05T07:55:00Z")
+    func.to_char(
+        func.timezone("UTC", Review.submitted_at), 'YYYY-MM-DD"T"HH24:MI:SS"Z"'
+    ).label("submittedAt"),
+    Review.submitted_at.label("date"),
+    Review.stay_date.label("stayDate"),
+    Review.stay_length.label("stayLength"),
+    Review.is_approved.label("isApproved"),
+)
+
+# Read statements built once at import time; SQLAlchemy's compiled cache then
+# serves the SQL, and the lambda statements also skip cache-key generation
+_STMT_BY_ID = select(Review).where(Review.id == bindparam("review_id"))
+
+# Keyset pages, newest first with id as tiebreaker; "after" pages continue below
+# the (submitted_at, id) of the previous page's last row
+_KEYSET_AFTER = (
+    tuple_(Review.submitted_at, Review.id)
+    < tuple_(bindparam("after_submitted_at"), bindparam("after_id"))
+)
+_STMT_PAGE_ALL = (
+    select(Review)
+    .order_by(Review.submitted_at.desc(), Review.id.desc())
+    .limit(bindparam("limit"))
+)
+_STMT_PAGE_ALL_AFTER = _STMT_PAGE_ALL.where(_KEYSET_AFTER)
+_STMT_PAGE_BY_LISTING = _STMT_PAGE_ALL.where(Review.listing_id == bindparam("listing_id"))
+_STMT_PAGE_BY_LISTING_AFTER = _STMT_PAGE_BY_LISTING.where(_KEYSET_AFTER)
+
+_STMT_APPROVAL_STATUS = select(Review.is_approved).where(Review.id == bindparam("review_id"))
+_STMT_APPROVED = (
+    select(Review)
+    .where(Review.is_approved == True)
+    .order_by(Review.submitted_at.desc())
+)
+_STMT_APPROVED_BY_LISTING = lambda_stmt(
+    lambda: select(Review)
+    .where(Review.is_approved == True)
+    .where(Review.listing_id == bindparam("listing_id"))
+    .order_by(Review.submitted_at.desc())
+)
+_STMT_APPROVED_IDS = (
+    select(Review.id)
+    .where(Review.is_approved == True)
+    .order_by(Review.submitted_at.desc())
+)
+_STMT_APPROVED_IDS_BY_LISTING = lambda_stmt(
+    lambda: select(Review.id)
+    .where(Review.is_approved == True)
+    .where(Review.listing_id == bindparam("listing_id"))
+    .order_by(Review.submitted_at.desc())
+)
+_STMT_ALL_NORMALIZED = (
+    select(*_NORMALIZED_REVIEW_COLUMNS)
+    .order_by(Review.submitted_at.desc())
+)
+_STMT_APPROVED_NORMALIZED = (
+    select(*_NORMALIZED_REVIEW_COLUMNS)
+    .where(Review.is_approved == True)
+    .order_by(Review.submitted_at.desc())
+)
+_STMT_APPROVED_NORMALIZED_BY_LISTING = lambda_stmt(
+    lambda: select(*_NORMALIZED_REVIEW_COLUMNS)
+    .where(Review.is_approved == True)
+    .where(Review.listing_id == bindparam("listing_id"))
+    .order_by(Review.submitted_at.desc())
+)
+
+# Change counter of the reviews table, bumped by a trigger on every write (see ReviewsVersion)
+_STMT_STATE_TOKEN = select(ReviewsVersion.version).where(ReviewsVersion.id == 1)
+
+# Columns written by the COPY bulk load, in record order
+_COPY_COLUMNS = (
+    "id", "listing_id", "listing_name", "listing_location", "channel", "type",
+    "status", "rating", "overall_rating", "category_ratings", "public_review",
+    "private_note", "guest_name", "submitted_at", "stay_date", "stay_length",
+    "is_approved",
+)
+_COPY_COLUMN_LIST = ", ".join(_COPY_COLUMNS)
+
+# Single-review approval update; RETURNING hands back the updated row in the same
+# round trip (populate_existing refreshes it if already loaded in the session)
+_STMT_SET_APPROVAL = (
+    update(Review)
+    .where(Review.id == bindparam("review_id"))
+    .values(
+        is_approved=bindparam("approved"),
+        approved_at=case((bindparam("approved"), func.now()), else_=None)
+    )
+    .returning(Review)
+    .execution_options(populate_existing=True)
+)
+
+# Bulk approval update keyed by "= ANY(array)": one prepared statement for any
+# number of IDs, unlike IN (...) which renders a placeholder per ID. Session
+# synchronization is off, so loaded Review objects are not swept or updated.
+_STMT_SET_APPROVAL_MANY = (
+    update(Review)
+    .where(Review.id == any_(bindparam("review_ids", type_=ARRAY(Integer))))
+    .values(
+        is_approved=bindparam("approved"),
+        approved_at=case((bindparam("approved"), func.now()), else_=None)
+    )
+    .returning(Review.id)
+    .execution_options(synchronize_session=False)
+)
+
+# Approval status lookup for a set of IDs, bound as one integer array like the bulk update
+_STMT_APPROVAL_MAP = (
+    select(Review.id, Review.is_approved)
+    .where(Review.id == any_(bindparam("review_ids", type_=ARRAY(Integer))))
+)
+
+# Default page size of the keyset-paginated get_all and get_by_listing
+_DEFAULT_PAGE_SIZE = 100
+
+# Above this many reviews, bulk_create_or_update loads through COPY instead
+_COPY_THRESHOLD = 500
+
+# Columns refreshed when an incoming review already exists; approval status is
+# never overwritten, matching create_or_update
+_UPSERT_UPDATE_COLUMNS = (
+    "listing_id", "listing_name", "listing_location", "channel", "type",
+    "status", "rating", "overall_rating", "category_ratings", "public_review",
+    "private_note", "guest_name", "submitted_at", "stay_date", "stay_length",
+)
+
+_STMT_UPSERT = pg_insert(Review)
+_STMT_UPSERT = _STMT_UPSERT.on_conflict_do_update(
+    index_elements=[Review.id],
+    set_={
+        **{column: _STMT_UPSERT.excluded[column] for column in _UPSERT_UPDATE_COLUMNS},
+        "updated_at": func.now(),
+    }
+)
+
+# Same upsert semantics as create_or_update: approval status is never overwritten
+_COPY_UPSERT_SQL = (
+    f"INSERT INTO reviews ({_COPY_COLUMN_LIST}) "
+    f"SELECT {_COPY_COLUMN_LIST} FROM _reviews_copy "
+    "ON CONFLICT (id) DO UPDATE SET "
+    + ", ".join(
+        f"{column} = EXCLUDED.{column}"
+        for column in _COPY_COLUMNS
+        if column not in ("id", "is_approved")
+    )
+    + ", updated_at = now()"
+)
+
 
 class ReviewRepository:
     """Repository for review database operations"""
     
     @staticmethod
-    async def get_all(db: AsyncSession) -> List[Review]:
+    async def get_all(
+        db: AsyncSession,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = _DEFAULT_PAGE_SIZE
+    ) -> List[Review]:
         """
-        Get all reviews from database.
+        Get a page of reviews from database, newest first.
+        
+        Keyset pagination: pass the (submitted_at, id) of the last review of the
+        previous page as ``after`` to get the next one.
         
         Args:
             db: Database session
+            after: (submitted_at, id) to continue after, or None for the first page
+            limit: Maximum number of reviews (must be positive)
             
         Returns:
             List of Review objects
+            
+        Raises:
+            ValueError: If limit is not positive
         """
-        result = await db.execute(select(Review).order_by(Review.submitted_at.desc()))
+        ReviewRepository._check_limit(limit)
+        if after is not None:
+            result = await db.execute(
+                _STMT_PAGE_ALL_AFTER,
+                {"after_submitted_at": after[0], "after_id": after[1], "limit": limit}
+            )
+        else:
+            result = await db.execute(_STMT_PAGE_ALL, {"limit": limit})
         return list(result.scalars().all())
     
+    @staticmethod
+    def _check_limit(limit: int) -> None:
+        """Reject page sizes that would return nothing or lift the LIMIT"""
+        if limit < 1:
+            raise ValueError(f"limit must be a positive integer, got {limit}")
+    
+    @staticmethod
+    async def has_any(db: AsyncSession) -> bool:
+        """
+        Check whether the reviews table contains at least one row.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            True if any review exists
+        """
+        result = await db.execute(select(select(Review.id).exists()))
+        return bool(result.scalar())
+    
+    @staticmethod
+    async def get_state_token(db: AsyncSession) -> str:
+        """
+        Get a token that changes whenever reviews are created, updated or deleted.
+        
+        Reads the single-row reviews_version counter by primary key. It only
+        increases, in commit order, so a token is never reused for different
+        table contents. Used to build ETags for the review list endpoints.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Token string of the current table version
+        """
+        version = (await db.execute(_STMT_STATE_TOKEN)).scalar_one_or_none()
+        return str(version or 0)
+    
     @staticmethod
     async def get_by_id(db: AsyncSession, review_id: int) -> Optional[Review]:
         """
@@ -41,26 +272,84 @@ class ReviewRepository:
         Returns:
             Review object or None
         """
-        result = await db.execute(select(Review).where(Review.id == review_id))
+        result = await db.execute(_STMT_BY_ID, {"review_id": review_id})
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_by_listing(db: AsyncSession, listing_id: str) -> List[Review]:
+    async def get_approval_status(db: AsyncSession, review_id: int) -> Optional[bool]:
         """
-        Get reviews by listing ID.
+        Get approval status for a review without loading the row.
+        
+        Args:
+            db: Database session
+            review_id: Review ID
+            
+        Returns:
+            Approval status (True/False) or None if not found
+        """
+        result = await db.execute(_STMT_APPROVAL_STATUS, {"review_id": review_id})
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def get_approval_map(db: AsyncSession, review_ids: List[int]) -> Dict[int, bool]:
+        """
+        Get approval status for the given review IDs.
+        
+        Selects only id and is_approved through the primary key in one query;
+        the IDs are a single array parameter, so there is no bind limit to chunk around.
+        
+        Args:
+            db: Database session
+            review_ids: List of review IDs
+            
+        Returns:
+            Dictionary mapping review_id to approval status (missing IDs are omitted)
+        """
+        if not review_ids:
+            return {}
+        
+        result = await db.execute(_STMT_APPROVAL_MAP, {"review_ids": list(review_ids)})
+        return dict(result.tuples().all())
+    
+    @staticmethod
+    async def get_by_listing(
+        db: AsyncSession,
+        listing_id: str,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = _DEFAULT_PAGE_SIZE
+    ) -> List[Review]:
+        """
+        Get a page of reviews by listing ID, newest first.
+        
+        Keyset pagination as in get_all.
         
         Args:
             db: Database session
             listing_id: Listing identifier
+            after: (submitted_at, id) to continue after, or None for the first page
+            limit: Maximum number of reviews (must be positive)
             
         Returns:
             List of Review objects
+            
+        Raises:
+            ValueError: If limit is not positive
         """
-        result = await db.execute(
-            select(Review)
-            .where(Review.listing_id == listing_id)
-            .order_by(Review.submitted_at.desc())
-        )
+        ReviewRepository._check_limit(limit)
+        if after is not None:
+            result = await db.execute(
+                _STMT_PAGE_BY_LISTING_AFTER,
+                {
+                    "listing_id": listing_id,
+                    "after_submitted_at": after[0],
+                    "after_id": after[1],
+                    "limit": limit,
+                }
+            )
+        else:
+            result = await db.execute(
+                _STMT_PAGE_BY_LISTING, {"listing_id": listing_id, "limit": limit}
+            )
         return list(result.scalars().all())
     
     @staticmethod
@@ -75,15 +364,85 @@ class ReviewRepository:
         Returns:
             List of approved Review objects
         """
-        query = select(Review).where(Review.is_approved == True)
+        if listing_id:
+            result = await db.execute(_STMT_APPROVED_BY_LISTING, {"listing_id": listing_id})
+        else:
+            result = await db.execute(_STMT_APPROVED)
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def get_approved_ids(db: AsyncSession, listing_id: Optional[str] = None) -> List[int]:
+        """
+        Get IDs of approved reviews without loading the rows.
         
+        Args:
+            db: Database session
+            listing_id: Optional filter by listing ID
+            
+        Returns:
+            List of approved review IDs, newest first
+        """
         if listing_id:
-            query = query.where(Review.listing_id == listing_id)
+            result = await db.execute(_STMT_APPROVED_IDS_BY_LISTING, {"listing_id": listing_id})
+        else:
+            result = await db.execute(_STMT_APPROVED_IDS)
+        return list(result.scalars().all())
+    
+    @staticmethod
+    async def get_all_normalized(db: AsyncSession) -> List[NormalizedReview]:
+        """
+        Get all reviews as NormalizedReview objects in a single projection query.
         
-        query = query.order_by(Review.submitted_at.desc())
+        Args:
+            db: Database session
+            
+        Returns:
+            List of NormalizedReview objects, newest first
+        """
+        return await ReviewRepository._fetch_normalized(db, _STMT_ALL_NORMALIZED)
+    
+    @staticmethod
+    async def get_approved_normalized(
+        db: AsyncSession,
+        listing_id: Optional[str] = None
+    ) -> List[NormalizedReview]:
+        """
+        Get approved reviews as NormalizedReview objects in a single projection query.
         
-        result = await db.execute(query)
-        return list(result.scalars().all())
+        Args:
+            db: Database session
+            listing_id: Optional filter by listing ID
+            
+        Returns:
+            List of approved NormalizedReview objects, newest first
+        """
+        if listing_id:
+            return await ReviewRepository._fetch_normalized(
+                db, _STMT_APPROVED_NORMALIZED_BY_LISTING, {"listing_id": listing_id}
+            )
+        return await ReviewRepository._fetch_normalized(db, _STMT_APPROVED_NORMALIZED)
+    
+    @staticmethod
+    async def _fetch_normalized(
+        db: AsyncSession,
+        query,
+        params: Optional[dict] = None
+    ) -> List[NormalizedReview]:
+        """
+        Run a NormalizedReview projection query and build the models from its rows.
+        
+        Rows come from our own table, so validation is skipped via model_construct.
+        
+        Args:
+            db: Database session
+            query: Select over _NORMALIZED_REVIEW_COLUMNS
+            params: Optional bound parameter values
+            
+        Returns:
+            List of NormalizedReview objects
+        """
+        result = await db.execute(query, params)
+        return [NormalizedReview.model_construct(**row) for row in result.mappings()]
     
     @staticmethod
     async def create_or_update(db: AsyncSession, normalized_review: NormalizedReview) -> Review:
@@ -160,6 +519,12 @@ class ReviewRepository:
         """
         Bulk create or update reviews.
         
+        Runs one INSERT ... ON CONFLICT (id) DO UPDATE through the driver's
+        executemany. Loads larger than _COPY_THRESHOLD go through
+        bulk_copy_reviews instead. Approval status of
+        existing reviews is left untouched, as in create_or_update. Commits once
+        at the end.
+        
         Args:
             db: Database session
             normalized_reviews: List of NormalizedReview objects
@@ -167,16 +532,119 @@ class ReviewRepository:
         Returns:
             Number of reviews processed
         """
-        count = 0
-        for normalized_review in normalized_reviews:
-            try:
-                await ReviewRepository.create_or_update(db, normalized_review)
-                count += 1
-            except Exception as e:
-                logger.error(f"Error saving review {normalized_review.id}: {e}")
-                await db.rollback()
+        if len(normalized_reviews) > _COPY_THRESHOLD:
+            return await ReviewRepository.bulk_copy_reviews(db, normalized_reviews)
+        
+        if not normalized_reviews:
+            return 0
+        
+        try:
+            await db.execute(
+                _STMT_UPSERT,
+                [ReviewRepository._to_column_values(review) for review in normalized_reviews]
+            )
+        except Exception as e:
+            logger.error(
+                "Error saving reviews %s-%s: %s",
+                normalized_reviews[0].id, normalized_reviews[-1].id, e
+            )
+            await db.rollback()
+            raise
         
-        return count
+        await db.commit()
+        return len(normalized_reviews)
+    
+    @staticmethod
+    def _to_column_values(normalized_review: NormalizedReview) -> Dict[str, object]:
+        """
+        Map a NormalizedReview to Review column values for bulk statements.
+        
+        Args:
+            normalized_review: NormalizedReview object
+            
+        Returns:
+            Dictionary keyed by Review attribute name
+        """
+        return {
+            "id": normalized_review.id,
+            "listing_id": normalized_review.listingId,
+            "listing_name": normalized_review.listingName,
+            "listing_location": normalized_review.listingLocation,
+            "channel": normalized_review.channel,
+            "type": normalized_review.type,
+            "status": normalized_review.status,
+            "rating": normalized_review.rating,
+            "overall_rating": normalized_review.overallRating,
+            "category_ratings": normalized_review.categoryRatings,
+            "public_review": normalized_review.publicReview,
+            "private_note": normalized_review.privateNote,
+            "guest_name": normalized_review.guestName,
+            "submitted_at": ReviewRepository._parse_datetime(normalized_review.submittedAt),
+            "stay_date": normalized_review.stayDate,
+            "stay_length": normalized_review.stayLength,
+            "is_approved": normalized_review.isApproved,
+        }
+    
+    @staticmethod
+    async def bulk_copy_reviews(
+        db: AsyncSession,
+        normalized_reviews: List[NormalizedReview]
+    ) -> int:
+        """
+        Bulk create or update reviews using PostgreSQL COPY.
+        
+        Rows are streamed into a temporary staging table with asyncpg's binary COPY and merged
+        into reviews with a single INSERT ... ON CONFLICT DO UPDATE, avoiding
+        per-row statement overhead for large loads.
+        
+        Args:
+            db: Database session
+            normalized_reviews: List of NormalizedReview objects
+            
+        Returns:
+            Number of reviews processed
+        """
+        records = [
+            (
+                review.id,
+                review.listingId,
+                review.listingName,
+                review.listingLocation,
+                review.channel,
+                review.type,
+                review.status,
+                review.rating,
+                review.overallRating,
+                json.dumps(review.categoryRatings),
+                review.publicReview,
+                review.privateNote,
+                review.guestName,
+                ReviewRepository._parse_datetime(review.submittedAt),
+                review.stayDate,
+                review.stayLength,
+                review.isApproved,
+            )
+            for review in normalized_reviews
+        ]
+        
+        # Run on the session's own connection; asyncpg nests this in a savepoint
+        # if the session already has a transaction open
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        asyncpg_connection = raw_connection.driver_connection
+        
+        async with asyncpg_connection.transaction():
+            await asyncpg_connection.execute(
+                "CREATE TEMP TABLE _reviews_copy (LIKE reviews INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            await asyncpg_connection.copy_records_to_table(
+                "_reviews_copy", records=records, columns=_COPY_COLUMNS
+            )
+            await asyncpg_connection.execute(_COPY_UPSERT_SQL)
+            await asyncpg_connection.execute("DROP TABLE _reviews_copy")
+        
+        await db.commit()
+        return len(records)
     
     @staticmethod
     async def set_approval_status(
@@ -195,15 +663,13 @@ class ReviewRepository:
         Returns:
             Updated Review object or None if not found
         """
-        review = await ReviewRepository.get_by_id(db, review_id)
-        if not review:
-            return None
-        
-        review.is_approved = is_approved
-        review.approved_at = datetime.utcnow() if is_approved else None
+        result = await db.execute(
+            _STMT_SET_APPROVAL,
+            {"review_id": review_id, "approved": is_approved}
+        )
+        review = result.scalar_one_or_none()
         
         await db.commit()
-        await db.refresh(review)
         return review
     
     @staticmethod
@@ -215,6 +681,9 @@ class ReviewRepository:
         """
         Bulk set approval status.
         
+        Review objects already loaded in the session are not updated; callers that
+        keep using them afterwards should call db.expire_all() first.
+        
         Args:
             db: Database session
             review_ids: List of review IDs
@@ -223,30 +692,24 @@ class ReviewRepository:
         Returns:
             Number of reviews updated
         """
-        approved_at = datetime.utcnow() if is_approved else None
-        
-        await db.execute(
-            update(Review)
-            .where(Review.id.in_(review_ids))
-            .values(
-                is_approved=is_approved,
-                approved_at=approved_at
-            )
+        # Single UPDATE; the database stamps approved_at and returns the updated IDs
+        result = await db.execute(
+            _STMT_SET_APPROVAL_MANY,
+            {"review_ids": list(review_ids), "approved": is_approved}
         )
+        updated_ids = result.scalars().all()
         
         await db.commit()
         
-        # Get count of updated reviews
-        result = await db.execute(
-            select(Review.id).where(Review.id.in_(review_ids))
-        )
-        return len(list(result.scalars().all()))
+        return len(updated_ids)
     
     @staticmethod
     def to_normalized_review(review: Review) -> NormalizedReview:
         """
         Convert database Review to NormalizedReview Pydantic model.
         
+        Only for rows read from the database; API input must go through validation.
+        
         Args:
             review: Review database object
             
@@ -257,18 +720,20 @@ class ReviewRepository:
         if review.submitted_at:
             # Convert to UTC if timezone-aware, otherwise assume UTC
             if review.submitted_at.tzinfo is not None:
-                submitted_at_utc = review.submitted_at.astimezone(timezone.utc)
+                submitted_at_utc = review.submitted_at.astimezone(_UTC)
             else:
-                submitted_at_utc = review.submitted_at.replace(tzinfo=timezone.utc)
-            # Format as ISO 8601 with Z suffix (e.g., "2024-11-05T07:55:00Z")
-            submitted_at_str = submitted_at_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+                submitted_at_utc = review.submitted_at.replace(tzinfo=_UTC)
+            # Format as ISO 8601 with Z suffix (e.g., "2024-11-05T07:55:00Z");
+            # isoformat is cheaper than strftime, then "+00:00" is swapped for "Z"
+            submitted_at_str = submitted_at_utc.isoformat(timespec="seconds")[:-6] + "Z"
         else:
             submitted_at_str = ""
         
         # Set date from submitted_at datetime
         date_value = review.submitted_at if review.submitted_at else None
         
-        return NormalizedReview(
+        # Values come from our own table, so skip validation
+        return NormalizedReview.model_construct(
             id=review.id,
             listingId=review.listing_id,
             listingName=review.listing_name,
@@ -299,13 +764,19 @@ class ReviewRepository:
             
         Returns:
             Datetime object
+            
+        Raises:
+            ValueError: If date string cannot be parsed
         """
-        try:
-            # Try ISO format first
-            if 'T' in date_string or date_string.endswith('Z'):
-                return datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-            # Fall back to Hostaway format
+        # Dispatch on the fixed-width shape up front, so no try/except is set up per row
+        length = len(date_string)
+        if length >= 19 and date_string[10] == 'T':
+            # Normalized "YYYY-MM-DDTHH:MM:SSZ" parses as-is on 3.11+; older versions
+            # need the Z spelled as an offset (cheaper than datetime.replace(tzinfo=...))
+            if not _FROMISOFORMAT_ACCEPTS_Z and date_string[-1] == 'Z':
+                date_string = date_string[:-1] + '+00:00'
+            return datetime.fromisoformat(date_string)
+        # Hostaway format: "2020-08-21 22:45:14"
+        if length == 19 and date_string[4] == '-':
             return datetime.strptime(date_string, "%Y-%m-%d %H:%M:%S")
-        except ValueError as e:
-            raise ValueError(f"Invalid date format: {date_string}") from e
-
+        raise ValueError(f"Invalid date format: {date_string}")